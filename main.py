@@ -19,14 +19,17 @@ Usage:
 import argparse
 import json
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from os import environ
-from os.path import exists, isfile
+from os.path import isfile
 from uuid import uuid4
 
-from services.encoder import BertTextEncoder
-from services.topic_extractor import LDATopicExtractor
-from services.transcribers import AAITranscriber
-from services.vector_database import PineconeVDB
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 warnings.filterwarnings("ignore")
 
@@ -35,32 +38,51 @@ def verify_files(files: list[str], check_extension: str = None):
     for file in files:
         if check_extension and not file.endswith(check_extension):
             raise Exception(f'File: {file} does not match the {check_extension} pattern')
-        if not exists(file) and not isfile(file):
-            raise Exception(f'File: {file} is not valid or not exists')
+    with ThreadPoolExecutor(max_workers=min(len(files), 16)) as executor:
+        for file, valid in zip(files, executor.map(isfile, files)):
+            if not valid:
+                raise Exception(f'File: {file} is not valid or not exists')
 
 
 def save_command(args):
+    # Imported here so a search run never pays the torch/sklearn import cost.
+    from services.encoder import BertTextEncoder
+    from services.preprocessing import PreprocessedCorpus
+    from services.topic_extractor import EmbeddingTopicExtractor
+    from services.transcribers import AAITranscriber
+    from services.vector_database import PineconeVDB
+
     verify_files(args.file)
-    transcriber = AAITranscriber()
-    transcriptions = transcriber.transcribe_many(args.file)
-    topics = LDATopicExtractor()
-    transcriptions_topics = topics.get_topics(transcriptions)
-    encoder = BertTextEncoder()
-    vectorized_data = encoder.encode(transcriptions)
-    vectors_input = [
-        {
-            "id": str(uuid4()),
-            "metadata": {"text": transcriptions_topics[idx]},
-            "values": vectorized_data[idx]
-        }
-        for idx in range(len(vectorized_data))
-    ]
-    vdb = PineconeVDB('test')
-    vdb.save(vectors_input)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # The encoder model load and the Pinecone handshake overlap with the
+        # network-bound transcription wait instead of running after it.
+        encoder_future = executor.submit(BertTextEncoder)
+        vdb_future = executor.submit(PineconeVDB, 'test')
+        transcriber = AAITranscriber()
+        transcriptions = transcriber.transcribe_many(args.file)
+        corpus = PreprocessedCorpus.build(transcriptions)
+        encoder = encoder_future.result()
+        vectorized_data = encoder.encode(transcriptions)
+        topics = EmbeddingTopicExtractor()
+        transcriptions_topics = topics.get_topics(transcriptions, vectorized_data, corpus=corpus)
+        ids = [uuid4().hex for _ in range(len(vectorized_data))]
+        embeddings_matrix = vectorized_data.astype(np.float32, copy=False)
+        vectors_input = (
+            {
+                "id": ids[idx],
+                "metadata": {"text": transcriptions_topics[idx]},
+                "values": embeddings_matrix[idx].tolist()
+            }
+            for idx in range(len(ids))
+        )
+        vdb = vdb_future.result()
+        vdb.save(vectors_input)
     print("Completed!")
 
 
 def search_file_command(args):
+    from services.vector_database import PineconeVDB
+
     PREFIX = '[SEARCH RESULT]'
     metadata = None
     verify_files([args.file], '.csv')
@@ -68,16 +90,20 @@ def search_file_command(args):
         metadata = {"text": {"$in": args.metadata}}
     with open(args.file, 'r') as file:
         data = file.readline()
-        vector = [float(item) for item in data.split(',')]
-        if len(vector) != 768:
+        vector = np.fromstring(data, sep=',', dtype=np.float32)
+        if vector.shape[0] != 768:
             raise Exception('Your vector does not have a dimension of 768. Please fix this and try again.')
     vdb = PineconeVDB('test')
-    responses = vdb.query(vector, metadata, top_k=int(args.top_k))
+    responses = vdb.query(vector.tolist(), metadata, top_k=int(args.top_k))
     print(PREFIX, f'Number os results: {len(responses)}')
     output = [response.to_dict() for response in responses]
     if args.output:
-        with open(args.output, 'w') as file:
-            file.write(json.dumps(output))
+        if orjson is not None:
+            with open(args.output, 'wb') as file:
+                file.write(orjson.dumps(output, option=orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(args.output, 'w') as file:
+                file.write(json.dumps(output))
         print(PREFIX, f'File {args.output} generated with success!')
 
 
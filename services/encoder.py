@@ -6,9 +6,14 @@ Classes:
     BertTextEncoder: A concrete implementation of TextEncoder using the BERT model for encoding.
 
 """
+from os import cpu_count, makedirs
+from os.path import exists, expanduser, join
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
+CACHE_DIR = expanduser('~/.cache/transcriber_cli')
+
 
 class TextEncoder:
     """
@@ -40,33 +45,162 @@ class BertTextEncoder(TextEncoder):
     """
     A concrete implementation of TextEncoder using the BERT model for encoding.
 
+    On first use the model is exported to ONNX and cached on disk, so later
+    CLI invocations skip the PyTorch model build and run through ONNX Runtime
+    instead. If onnxruntime is not installed the encoder falls back to the
+    regular SentenceTransformer path.
+
     Attributes:
         model (str): The name of the BERT model.
-        transformer (SentenceTransformer): The SentenceTransformer instance.
+        onnx_path (str): The on-disk location of the exported ONNX model.
+        transformer (SentenceTransformer): The SentenceTransformer instance (fallback path).
+        session (onnxruntime.InferenceSession): The ONNX Runtime session (fast path).
+        tokenizer: The HuggingFace fast tokenizer used with the ONNX session.
 
     Methods:
         encode: Encode a list of texts using the BERT model.
     """
 
     model = 'multi-qa-distilbert-dot-v1'
+    onnx_path = join(CACHE_DIR, 'distilbert.onnx')
 
     def __init__(self):
         """
         Initialize a BertTextEncoder instance.
 
-        The BERT model is initialized in this method.
+        On a CUDA machine the FP16 GPU transformer is preferred outright; the
+        ONNX session targets the CPU provider and would forfeit the GPU
+        speedup. Otherwise the cached ONNX model is tried first, falling back
+        to the regular SentenceTransformer when onnxruntime is unavailable.
+        """
+        self.transformer = None
+        self.session = None
+        self.tokenizer = None
+        import torch
+        if torch.cuda.is_available():
+            self._load_transformer()
+            return
+        try:
+            self._load_onnx()
+        except ImportError:
+            self._load_transformer()
+
+    def _load_transformer(self, quantize: bool = True, device: str = None):
+        """
+        Load the SentenceTransformer model used by the fallback encode path.
+
+        On a CUDA machine the model is moved to the GPU and cast to FP16,
+        which halves memory bandwidth and uses tensor-core matmuls.
+
+        Args:
+            quantize (bool, optional): Apply INT8 dynamic quantization to the
+                linear layers on CPU. This halves the model size and roughly
+                doubles CPU throughput at negligible quality cost. Defaults to True.
+            device (str, optional): Force a specific device; the ONNX export
+                passes 'cpu' so it traces an FP32 CPU copy even on CUDA
+                machines. Defaults to auto-detection.
+        """
+        if self.transformer is None:
+            import torch
+            if device is None:
+                device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            self.transformer = SentenceTransformer(self.model)
+            if device == 'cuda':
+                self.transformer = self.transformer.to('cuda').half()
+            elif quantize:
+                self.transformer = torch.quantization.quantize_dynamic(
+                    self.transformer, {torch.nn.Linear}, dtype=torch.qint8,
+                )
+
+    def _load_onnx(self):
+        """
+        Create the ONNX Runtime session, exporting the model first if needed.
+
+        Raises:
+            ImportError: If onnxruntime is not installed.
+        """
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        if not exists(self.onnx_path):
+            self._export_onnx()
+        self.tokenizer = AutoTokenizer.from_pretrained(f'sentence-transformers/{self.model}')
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = cpu_count()
+        self.session = onnxruntime.InferenceSession(
+            self.onnx_path,
+            sess_options=options,
+            providers=['CPUExecutionProvider'],
+        )
+
+    def _export_onnx(self):
+        """
+        Export the underlying BERT model to ONNX with dynamic batch/sequence axes.
+
+        This pays the full PyTorch load once; every later invocation reads the
+        cached file instead.
         """
-        self.transformer = SentenceTransformer(self.model)
+        import torch
+
+        print(self.PREFIX, self.__class__.__name__, 'Exporting model to ONNX (one time only)...')
+        makedirs(CACHE_DIR, exist_ok=True)
+        self._load_transformer(quantize=False, device='cpu')
+        bert = self.transformer._first_module().auto_model
+        dummy = self.transformer.tokenizer(['warm up'], return_tensors='pt')
+        torch.onnx.export(
+            bert,
+            (dummy['input_ids'], dummy['attention_mask']),
+            self.onnx_path,
+            input_names=['input_ids', 'attention_mask'],
+            output_names=['last_hidden_state'],
+            dynamic_axes={
+                'input_ids': {0: 'batch', 1: 'sequence'},
+                'attention_mask': {0: 'batch', 1: 'sequence'},
+                'last_hidden_state': {0: 'batch', 1: 'sequence'},
+            },
+        )
 
     def encode(self, texts: list[str]):
         """
         Encode a list of texts using the BERT model.
 
+        All texts are encoded in a single batched call so the model is entered
+        once instead of once per text, letting Sentence-Transformers sort and
+        pad the inputs efficiently.
+
         Args:
             texts (list[str]): A list of texts to encode.
 
         Returns:
-            list[dict]: A list of encoded texts.
+            numpy.ndarray: An array with one embedding per text.
         """
         print(self.PREFIX, self.__class__.__name__, 'Encoding inputs...')
-        return [self.transformer.encode(text) for text in texts]
+        if self.session is not None:
+            return self._encode_onnx(texts)
+        embeddings = self.transformer.encode(
+            texts,
+            batch_size=1024,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        # FP16 embeddings from the GPU path are widened back to FP32 since
+        # Pinecone serializes plain JSON floats.
+        return embeddings.astype(np.float32, copy=False)
+
+    def _encode_onnx(self, texts: list[str]):
+        """
+        Encode a list of texts through the cached ONNX session.
+
+        Args:
+            texts (list[str]): A list of texts to encode.
+
+        Returns:
+            numpy.ndarray: An array with one embedding per text.
+        """
+        tokens = self.tokenizer(texts, padding=True, truncation=True, max_length=512, return_tensors='np')
+        hidden = self.session.run(None, {
+            'input_ids': tokens['input_ids'],
+            'attention_mask': tokens['attention_mask'],
+        })[0]
+        # The dot-product models pool with the CLS token, not mean pooling.
+        return hidden[:, 0]
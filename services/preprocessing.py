@@ -0,0 +1,47 @@
+"""
+This module contains the shared preprocessing pass over a transcription corpus.
+
+Classes:
+    PreprocessedCorpus: The result of tokenizing a corpus once, shared by the topic extractors.
+
+"""
+from dataclasses import dataclass
+
+from sklearn.feature_extraction.text import CountVectorizer
+
+custom_stop_words = ["is", "of", "for", "the", "a", "an", "are", "in", "on", "at", "and", "to"]
+
+
+@dataclass
+class PreprocessedCorpus:
+    """
+    The result of tokenizing a corpus once.
+
+    Both topic extractors need a bag-of-words view of the same texts; building
+    it here once means the corpus is walked a single time instead of once per
+    extractor.
+
+    Attributes:
+        texts (list[str]): The original texts, in order.
+        vectorizer (CountVectorizer): The fitted vectorizer holding the vocabulary.
+        token_counts: The sparse document-term matrix, one row per text.
+    """
+
+    texts: list[str]
+    vectorizer: CountVectorizer
+    token_counts: object
+
+    @classmethod
+    def build(cls, texts: list[str]) -> 'PreprocessedCorpus':
+        """
+        Tokenize and count a corpus in a single pass.
+
+        Args:
+            texts (list[str]): The texts to preprocess.
+
+        Returns:
+            PreprocessedCorpus: The corpus with its fitted vectorizer and counts.
+        """
+        vectorizer = CountVectorizer(stop_words=custom_stop_words)
+        token_counts = vectorizer.fit_transform(texts)
+        return cls(texts=texts, vectorizer=vectorizer, token_counts=token_counts)
@@ -4,13 +4,41 @@ This module contains classes for extracting topics from text.
 Classes:
     TopicExtractor: An abstract base class for a topic extractor.
     LDATopicExtractor: A concrete implementation of TopicExtractor using the Latent Dirichlet Allocation (LDA) model for topic extraction.
+    EmbeddingTopicExtractor: A concrete implementation of TopicExtractor that clusters precomputed embeddings.
 
 """
+import hashlib
+from os import makedirs
+from os.path import exists, expanduser, join
 
+import joblib
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.decomposition import LatentDirichletAllocation
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer, TfidfVectorizer
 
-custom_stop_words = ["is", "of", "for", "the", "a", "an", "are", "in", "on", "at", "and", "to"]
+from services.preprocessing import PreprocessedCorpus, custom_stop_words
+
+CACHE_DIR = expanduser('~/.cache/transcriber_cli')
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Return the indices of the top_k largest scores, highest first.
+
+    Uses argpartition (O(V)) to select the candidates and only sorts those
+    top_k entries, instead of fully sorting the whole vocabulary-length vector.
+
+    Args:
+        scores (np.ndarray): A 1-D array of scores.
+        top_k (int): The number of indices to return.
+
+    Returns:
+        np.ndarray: The indices of the top_k scores in descending score order.
+    """
+    top_k = min(top_k, scores.shape[0])
+    idx = np.argpartition(scores, -top_k)[-top_k:]
+    return idx[np.argsort(scores[idx])[::-1]]
 
 
 class TopicExtractor:
@@ -47,27 +75,132 @@ class LDATopicExtractor(TopicExtractor):
         get_topics: Extract topics from a list of texts using the LDA model.
     """
 
-    def get_topics(self, texts: list[str], top_k=5) -> list[list[str]]:
+    def get_topics(self, texts: list[str], top_k=5, n_topics: int = None,
+                   corpus: PreprocessedCorpus = None) -> list[list[str]]:
         """
         Extract topics from a list of texts using the LDA model.
 
+        The number of topics is kept small and independent of the corpus size
+        (LDA assumes far fewer topics than documents); each text is then
+        assigned the topic it loads on most heavily.
+
         Args:
             texts (list[str]): A list of texts to extract topics from.
-            top_k (int, optional): The number of top topics to return. Defaults to 5.
+            top_k (int, optional): The number of top words to return per topic. Defaults to 5.
+            n_topics (int, optional): The number of topics to fit. Defaults to
+                min(10, max(2, len(texts))).
+            corpus (PreprocessedCorpus, optional): An already tokenized corpus
+                to reuse, skipping the vectorizer pass over the texts.
 
         Returns:
-            list[list[str]]: A list of top topics for each text.
+            list[list[str]]: A list of top topic words for each text.
         """
-        vectorizer = CountVectorizer(stop_words=custom_stop_words)
-        lda = LatentDirichletAllocation(n_components=len(texts), random_state=42)  # 42 picked just for fun
-        lda.fit(vectorizer.fit_transform(texts))
+        if n_topics is None:
+            n_topics = min(10, max(2, len(texts)))
+        if corpus is not None:
+            vectorizer, counts = corpus.vectorizer, corpus.token_counts
+        else:
+            vectorizer, counts = self._vectorize(texts)
+        lda = LatentDirichletAllocation(
+            n_components=n_topics,
+            learning_method='online',
+            batch_size=128,
+            n_jobs=-1,
+            random_state=42,  # 42 picked just for fun
+        )
+        doc_topics = lda.fit_transform(counts)
 
         feature_names = vectorizer.get_feature_names_out()
+        topic_words = []
+        for topic in lda.components_:
+            top_words_idx = _top_k_indices(topic, top_k)
+            topic_words.append([feature_names[i] for i in top_words_idx])
+
+        topics = []
+        for idx, text in enumerate(texts):
+            top_words = topic_words[doc_topics[idx].argmax()]
+            print(self.PREFIX, self.__class__.__name__, 'Topics found for:', text)
+            print('\t', top_words)
+            topics.append(top_words)
+
+        return topics
+
+    def _vectorize(self, texts: list[str]):
+        """
+        Fit the CountVectorizer for a corpus, reusing a cached fit when the
+        same corpus was vectorized before.
+
+        The corpus is keyed by a blake2b hash of the texts and the fitted
+        vectorizer plus document-term matrix are persisted with joblib, so
+        repeated runs over the same transcriptions skip the vocabulary build.
+
+        Args:
+            texts (list[str]): A list of texts to vectorize.
+
+        Returns:
+            tuple: The fitted CountVectorizer and the document-term matrix.
+        """
+        corpus_hash = hashlib.blake2b('\x00'.join(texts).encode(), digest_size=16).hexdigest()
+        cache_path = join(CACHE_DIR, f'cv_{corpus_hash}.joblib')
+        if exists(cache_path):
+            return joblib.load(cache_path)
+        vectorizer = CountVectorizer(stop_words=custom_stop_words)
+        counts = vectorizer.fit_transform(texts)
+        makedirs(CACHE_DIR, exist_ok=True)
+        joblib.dump((vectorizer, counts), cache_path, compress=3)
+        return vectorizer, counts
+
+
+class EmbeddingTopicExtractor(TopicExtractor):
+    """
+    A concrete implementation of TopicExtractor that clusters precomputed embeddings.
+
+    Instead of re-vectorizing the corpus and fitting LDA, the texts are grouped
+    with a small k-means over embeddings that were already computed for the
+    vector database, and each cluster is labeled with its top TF-IDF terms.
+
+    Methods:
+        get_topics: Extract topics from a list of texts using their embeddings.
+    """
+
+    def get_topics(self, texts: list[str], embeddings, top_k=5,
+                   corpus: PreprocessedCorpus = None) -> list[list[str]]:
+        """
+        Extract topics from a list of texts using their embeddings.
+
+        Args:
+            texts (list[str]): A list of texts to extract topics from.
+            embeddings: The embedding matrix for the texts, one row per text.
+            top_k (int, optional): The number of top words to return per topic. Defaults to 5.
+            corpus (PreprocessedCorpus, optional): An already tokenized corpus
+                to reuse; the TF-IDF weights are then derived from its counts
+                instead of re-walking the texts.
+
+        Returns:
+            list[list[str]]: A list of top topic words for each text.
+        """
+        n_clusters = min(10, len(texts))
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=256, random_state=42)
+        labels = kmeans.fit_predict(embeddings)
+
+        if corpus is not None:
+            tfidf = TfidfTransformer().fit_transform(corpus.token_counts)
+            feature_names = corpus.vectorizer.get_feature_names_out()
+        else:
+            vectorizer = TfidfVectorizer(stop_words=custom_stop_words)
+            tfidf = vectorizer.fit_transform(texts)
+            feature_names = vectorizer.get_feature_names_out()
+
+        cluster_words = {}
+        for cluster in range(n_clusters):
+            scores = np.asarray(tfidf[labels == cluster].sum(axis=0)).ravel()
+            top_words_idx = _top_k_indices(scores, top_k)
+            cluster_words[cluster] = [feature_names[i] for i in top_words_idx]
+
         topics = []
-        for topic_idx, topic in enumerate(lda.components_):
-            print(self.PREFIX, self.__class__.__name__, 'Topics found for:', texts[topic_idx])
-            top_words_idx = topic.argsort()[:-top_k - 1:-1]
-            top_words = [feature_names[i] for i in top_words_idx]
+        for idx, text in enumerate(texts):
+            top_words = cluster_words[labels[idx]]
+            print(self.PREFIX, self.__class__.__name__, 'Topics found for:', text)
             print('\t', top_words)
             topics.append(top_words)
 
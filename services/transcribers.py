@@ -6,10 +6,18 @@ Classes:
     AAITranscriber: A concrete implementation of TranscriberService using the AssemblyAI API for transcribing.
 
 """
-from os import environ
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from os import environ, makedirs
+from os.path import exists, expanduser, join
+from time import sleep
+
 import assemblyai as aai
 from assemblyai import Transcript
 
+TRANSCRIPT_CACHE_DIR = expanduser('~/.cache/transcriber_cli/transcripts')
+
 
 class TranscriberService:
     """
@@ -79,25 +87,96 @@ class AAITranscriber(TranscriberService):
         Returns:
             list[str]: A list of transcribed sentences.
         """
-        transcript = self.transcriber.transcribe(file_path)
-        return self._get_sentences_from_transcript(transcript)
+        return self._transcribe_file(file_path)
+
+    MAX_WORKERS = 16
+    MAX_RETRIES = 3
 
     def transcribe_many(self, file_paths: list[str]):
         """
         Transcribes multiple audio files into text using the AssemblyAI API.
 
+        The files are submitted concurrently through a thread pool since each
+        transcription is a network-bound wait, so the total time is close to
+        the slowest file instead of the sum of all of them. The sentences are
+        returned in the same order the files were given.
+
         Args:
             file_paths (list[str]): A list of paths to the audio files to be transcribed.
 
         Returns:
             list[str]: A list of transcribed sentences from all audio files.
         """
-        transcripts = self.transcriber.transcribe_group(file_paths)
+        workers = min(len(file_paths), self.MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._transcribe_file, file_paths))
         transcriptions = []
-        for transcript in transcripts.transcripts:
-            transcriptions.extend(self._get_sentences_from_transcript(transcript))
+        for sentences in results:
+            transcriptions.extend(sentences)
         return transcriptions
 
+    def _transcribe_file(self, file_path: str) -> list[str]:
+        """
+        Transcribes a single file, reusing a cached result when the same
+        content was transcribed before.
+
+        Transcripts are cached on disk keyed by the SHA-256 of the file
+        content, so resubmitting a file skips the API round-trip entirely.
+
+        Args:
+            file_path (str): The path to the audio file to be transcribed.
+
+        Returns:
+            list[str]: A list of transcribed sentences.
+        """
+        file_hash = self._file_hash(file_path)
+        cache_path = join(TRANSCRIPT_CACHE_DIR, f'{file_hash}.json')
+        if exists(cache_path):
+            print(self.PREFIX, self.__class__.__name__, 'Cache hit for:', file_path)
+            with open(cache_path) as file:
+                return json.load(file)
+        transcript = self._transcribe_with_retry(file_path)
+        sentences = self._get_sentences_from_transcript(transcript)
+        makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w') as file:
+            json.dump(sentences, file)
+        return sentences
+
+    def _file_hash(self, file_path: str) -> str:
+        """
+        Computes the SHA-256 of a file's content in streaming 1MB chunks.
+
+        Args:
+            file_path (str): The path to the file to hash.
+
+        Returns:
+            str: The hex digest of the file content.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            while chunk := file.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _transcribe_with_retry(self, file_path: str) -> Transcript:
+        """
+        Submits a single file for transcription, retrying with exponential backoff.
+
+        Args:
+            file_path (str): The path to the audio file to be transcribed.
+
+        Returns:
+            Transcript: The completed transcript for the file.
+        """
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                return self.transcriber.transcribe(file_path)
+            except Exception as ex:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise ex
+                print(self.PREFIX, self.__class__.__name__, 'Retrying', file_path, 'after error:', ex)
+                sleep(2 ** attempt)
+
     def _get_sentences_from_transcript(self, transcript: Transcript) -> list[str]:
         """
         Extracts sentences from a transcript.
@@ -108,10 +187,9 @@ class AAITranscriber(TranscriberService):
         Returns:
             list[str]: A list of sentences extracted from the transcript.
         """
-        print(self.PREFIX, self.__class__.__name__, 'File:', transcript.audio_url, 'Sentences found:')
-        sentences = []
-        sentences_obj = transcript.get_sentences()
-        for sentence in sentences_obj:
-            print('\t-', sentence.text)
-            sentences.append(sentence.text)
+        sentences = [sentence.text for sentence in transcript.get_sentences()]
+        print(
+            self.PREFIX, self.__class__.__name__, 'File:', transcript.audio_url, 'Sentences found:',
+            '\n\t- ' + '\n\t- '.join(sentences),
+        )
         return sentences
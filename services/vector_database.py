@@ -6,10 +6,82 @@ Classes:
     PineconeVDB: A concrete implementation of VectorDB using Pinecone as the vector database.
 
 """
-from os import environ
+import json
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from functools import lru_cache
+from os import environ, makedirs
+from os.path import dirname, expanduser
+from time import time
 
 from pinecone import Pinecone, ScoredVector
 
+INDEX_CACHE_FILE = expanduser('~/.cache/transcriber_cli/indexes.json')
+INDEX_CACHE_TTL = 300
+
+
+def _cached_host(index: str):
+    """
+    Return the cached host URL for an index if the cache entry is still fresh.
+
+    Args:
+        index (str): The name of the Pinecone index.
+
+    Returns:
+        str: The cached host URL, or None on a miss or stale entry.
+    """
+    try:
+        with open(INDEX_CACHE_FILE) as file:
+            cache = json.load(file)
+        entry = cache.get(index)
+        if entry and time() - entry['time'] < INDEX_CACHE_TTL:
+            return entry['host']
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _store_host(index: str, host: str):
+    """
+    Persist the resolved host URL for an index so cold CLI starts can skip
+    the describe-index round-trip.
+
+    Args:
+        index (str): The name of the Pinecone index.
+        host (str): The resolved host URL.
+    """
+    try:
+        with open(INDEX_CACHE_FILE) as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        cache = {}
+    cache[index] = {'host': host, 'time': time()}
+    makedirs(dirname(INDEX_CACHE_FILE), exist_ok=True)
+    with open(INDEX_CACHE_FILE, 'w') as file:
+        json.dump(cache, file)
+
+
+@lru_cache(maxsize=8)
+def _resolve_index(api_key: str, index: str):
+    """
+    Resolve a Pinecone client and index handle, memoized per process and
+    backed by the on-disk host cache across processes.
+
+    Args:
+        api_key (str): The Pinecone API key.
+        index (str): The name of the Pinecone index.
+
+    Returns:
+        tuple: The Pinecone client and the resolved index handle.
+    """
+    pinecone = Pinecone(api_key)
+    host = _cached_host(index)
+    if host is None:
+        host = pinecone.describe_index(index).host
+        _store_host(index, host)
+    return pinecone, pinecone.Index(host=host)
+
 
 class VectorDB:
     """
@@ -19,12 +91,12 @@ class VectorDB:
        save: Save a list of vectors to the database. Not implemented in this base class.
     """
 
-    def save(self, vectors: list[dict]):
+    def save(self, vectors: Iterable[dict]):
         """
-        Save a list of vectors to the database.
+        Save vectors to the database.
 
         Args:
-            vectors (list[dict]): A list of vectors to save.
+            vectors (Iterable[dict]): The vectors to save.
 
         Raises:
             NotImplemented: This method is not implemented in the base class.
@@ -53,27 +125,49 @@ class PineconeVDB(VectorDB):
         """
         Initialize a PineconeVDB instance.
 
+        The index handle is memoized in-process and its host URL is cached on
+        disk with a short TTL, so repeated CLI invocations skip the
+        describe-index round-trip.
+
         Args:
             index (str): The name of the Pinecone index.
             namespace (str, optional): The namespace for the Pinecone index. Defaults to "ns1".
         """
         self.namespace = namespace
-        self.pinecone = Pinecone(environ.get('PINECONE_API_KEY'))
-        self.index = self.pinecone.Index(index)
+        self.pinecone, self.index = _resolve_index(environ.get('PINECONE_API_KEY'), index)
 
-    def save(self, vectors: list[dict]):
+    def save(self, vectors: Iterable[dict], batch_size=100):
         """
-        Save a list of vectors to the Pinecone index.
+        Save vectors to the Pinecone index.
+
+        Accepts any iterable, including generators, so callers can stream the
+        payload instead of materializing one large list. The vectors are
+        consumed in batches that stay under Pinecone's upsert limits and the
+        batches are uploaded concurrently.
 
         Args:
-            vectors (list[dict]): A list of vectors to save.
+            vectors (Iterable[dict]): The vectors to save.
+            batch_size (int, optional): The number of vectors per upsert request. Defaults to 100.
 
         Raises:
             Exception: If an error occurs during the upload.
         """
         try:
             print(self.prefix, 'Starting data upload...')
-            self.index.upsert(vectors=vectors, namespace=self.namespace)
+            vectors = iter(vectors)
+            workers = 4
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Cap the in-flight chunks so the generator is only consumed
+                # as uploads drain, instead of queueing the whole payload.
+                in_flight = set()
+                while chunk := list(islice(vectors, batch_size)):
+                    if len(in_flight) >= workers * 2:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    in_flight.add(executor.submit(self.index.upsert, vectors=chunk, namespace=self.namespace))
+                for future in in_flight:
+                    future.result()
             print(self.prefix, 'Upload completed...')
         except Exception as ex:
             print(self.prefix, 'Failed with error:', ex)
@@ -91,12 +185,13 @@ class PineconeVDB(VectorDB):
         Returns:
             list[ScoredVector]: A list of the most similar vectors.
         """
+        filter_kwargs = {'filter': metadata} if metadata else {}
         response = self.index.query(
             namespace=self.namespace,
             vector=vector,
             top_k=top_k,
             include_values=True,
-            include_metdata=True if metadata else False,
-            filter=metadata,
+            include_metadata=bool(metadata),
+            **filter_kwargs,
         )
         return response.matches